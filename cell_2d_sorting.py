@@ -4,28 +4,66 @@ Cells can sort 2D points (x,y) using different comparison strategies
 """
 
 import math
+from enum import IntEnum
+
+import numpy as np
+
+from tissue_kernels import as_value_array, keyed_pass
+
+
+class CmpMethod(IntEnum):
+    """Comparison strategies ('cognitive models') a cell can use."""
+
+    DISTANCE = 0
+    X_FIRST = 1
+    Y_FIRST = 2
+    SUM = 3
+
+    @classmethod
+    def from_name(cls, compare_method):
+        """Translate a name like 'x_first' (or a CmpMethod) to a CmpMethod."""
+        if isinstance(compare_method, cls):
+            return compare_method
+        try:
+            return cls[compare_method.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Unknown comparison method: {compare_method}") from None
 
 
 class Cell2D:
     """
-    A cell that holds 2D values (x, y) and can compare using different strategies.
+    A view of one cell in a Tissue2D, backed by the tissue's coordinate arrays.
     This demonstrates how cells can have different 'cognitive models' for decision-making.
     """
 
-    def __init__(self, x, y=None):
+    __slots__ = ("tissue", "index")
+
+    def __init__(self, tissue, index):
         """
-        Initialize with either:
-        - x, y as separate args
-        - (x, y) as a tuple/list
+        Initialize a view of the cell at `index` in `tissue`.
         """
-        if y is None and isinstance(x, (tuple, list)):
-            self.x, self.y = x
-        else:
-            self.x = x
-            self.y = y if y is not None else 0
+        self.tissue = tissue
+        self.index = index
+
+    @property
+    def x(self):
+        return self.tissue.x[self.index].item()
+
+    @property
+    def y(self):
+        return self.tissue.y[self.index].item()
 
-        self.left_neighbor = None
-        self.right_neighbor = None
+    @property
+    def left_neighbor(self):
+        if self.index == 0:
+            return None
+        return Cell2D(self.tissue, self.index - 1)
+
+    @property
+    def right_neighbor(self):
+        if self.index >= self.tissue.size - 1:
+            return None
+        return Cell2D(self.tissue, self.index + 1)
 
     def get_value(self):
         """Return the 2D value as a tuple."""
@@ -40,21 +78,24 @@ class Cell2D:
         Decision function with multiple comparison strategies.
 
         Args:
-            compare_method: One of 'distance', 'x_first', 'y_first', 'sum'
+            compare_method: One of 'distance', 'x_first', 'y_first', 'sum',
+                or a CmpMethod. Callers in a loop should resolve it once with
+                CmpMethod.from_name and pass the CmpMethod.
 
         Returns:
             True if this cell should swap with its right neighbor
         """
-        if not self.right_neighbor:
+        right = self.right_neighbor
+        if not right:
             return False
 
-        right = self.right_neighbor
+        method = CmpMethod.from_name(compare_method)
 
-        if compare_method == "distance":
+        if method == CmpMethod.DISTANCE:
             # Compare by distance from origin
             return self.distance_from_origin() > right.distance_from_origin()
 
-        elif compare_method == "x_first":
+        elif method == CmpMethod.X_FIRST:
             # Compare by x, then y
             if self.x > right.x:
                 return True
@@ -62,7 +103,7 @@ class Cell2D:
                 return True
             return False
 
-        elif compare_method == "y_first":
+        elif method == CmpMethod.Y_FIRST:
             # Compare by y, then x
             if self.y > right.y:
                 return True
@@ -70,35 +111,21 @@ class Cell2D:
                 return True
             return False
 
-        elif compare_method == "sum":
+        else:
             # Compare by sum of coordinates
             return (self.x + self.y) > (right.x + right.y)
 
-        else:
-            raise ValueError(f"Unknown comparison method: {compare_method}")
-
     def swap_with_right(self):
         """Execute a swap with the right neighbor."""
         if not self.right_neighbor:
             return False
 
-        right = self.right_neighbor
-
-        # Save the neighbors beyond the swap pair
-        left_of_self = self.left_neighbor
-        right_of_right = right.right_neighbor
-
-        # Update the outer neighbors to point to the swapped cells
-        if left_of_self:
-            left_of_self.right_neighbor = right
-        if right_of_right:
-            right_of_right.left_neighbor = self
+        i = self.index
+        for coords in (self.tissue.x, self.tissue.y):
+            coords[i], coords[i + 1] = coords[i + 1], coords[i]
 
-        # Swap the cells' positions
-        right.left_neighbor = left_of_self
-        right.right_neighbor = self
-        self.left_neighbor = right
-        self.right_neighbor = right_of_right
+        # The view follows its point to the right
+        self.index = i + 1
 
         return True
 
@@ -106,88 +133,101 @@ class Cell2D:
         return f"({self.x},{self.y})"
 
 
+def _as_point(p):
+    """Return the (x, y) of a Cell2D, an (x, y) tuple or list, or a scalar x."""
+    if isinstance(p, Cell2D):
+        return p.get_value()
+    if isinstance(p, (tuple, list)):
+        return p
+    return (p, 0)
+
+
 class Tissue2D:
-    """A 1D tissue array of 2D cells."""
+    """A 1D tissue array of 2D cells, stored as parallel x and y arrays."""
 
     def __init__(self, points):
         """
         Initialize tissue with 2D points.
 
         Args:
-            points: List of (x,y) tuples or Cell2D objects
+            points: List of (x,y) tuples, scalars (placed at (x, 0)), or Cell2D
+                views into another tissue (their current values are copied)
         """
-        if not points:
-            self.head = None
-            self.size = 0
-            return
-
-        # Create cells from points
-        cells = []
-        for p in points:
-            if isinstance(p, Cell2D):
-                cells.append(p)
-            else:
-                cells.append(Cell2D(p))
-
-        # Link them together
-        for i in range(len(cells)):
-            if i > 0:
-                cells[i].left_neighbor = cells[i - 1]
-            if i < len(cells) - 1:
-                cells[i].right_neighbor = cells[i + 1]
-
-        self.head = cells[0]
-        self.size = len(cells)
+        points = [_as_point(p) for p in points]
+
+        self.x = as_value_array([p[0] for p in points])
+        self.y = as_value_array([p[1] for p in points])
+        self.size = len(points)
+
+    @property
+    def head(self):
+        return Cell2D(self, 0) if self.size else None
 
     def to_list(self):
         """Convert to list of (x,y) tuples."""
-        result = []
-        current = self.head
-        while current:
-            result.append(current.get_value())
-            current = current.right_neighbor
-        return result
+        return list(zip(self.x.tolist(), self.y.tolist()))
 
-    def sort_step(self, compare_method="distance"):
-        """Execute one sorting pass using the specified comparison method."""
-        swapped = False
-        current = self.head
+    def sort_keys(self, method=CmpMethod.DISTANCE):
+        """
+        Compute the (primary, secondary) comparison keys of every cell.
 
-        while current and current.right_neighbor:
-            if current.should_swap_right(compare_method):
-                if current == self.head:
-                    self.head = current.right_neighbor
+        Args:
+            method: A CmpMethod
 
-                current.swap_with_right()
-                swapped = True
-                current = current.right_neighbor
-            else:
-                current = current.right_neighbor
+        Returns:
+            Two fresh float64 arrays; cells compare by primary key, then secondary
+        """
+        # float64 keys can't overflow like int64 coordinates would when
+        # squared or summed, and give keyed_pass a single dtype to compile for
+        x = self.x.astype(np.float64)
+        y = self.y.astype(np.float64)
 
-        return swapped
+        if method == CmpMethod.DISTANCE:
+            # Squared distance orders cells the same way, without a sqrt
+            return x * x + y * y, np.zeros(self.size)
+
+        elif method == CmpMethod.X_FIRST:
+            return x, y
+
+        elif method == CmpMethod.Y_FIRST:
+            return y, x
+
+        else:
+            return x + y, np.zeros(self.size)
+
+    def sort_step(self, compare_method="distance"):
+        """Execute one sorting pass using the specified comparison method."""
+        method = CmpMethod.from_name(compare_method)
+        primary, secondary = self.sort_keys(method)
+        return keyed_pass(primary, secondary, self.x, self.y)
 
     def sort(self, compare_method="distance", max_iterations=None, verbose=False):
         """
         Sort the tissue using the specified comparison method.
 
         Args:
-            compare_method: 'distance', 'x_first', 'y_first', or 'sum'
+            compare_method: 'distance', 'x_first', 'y_first', 'sum', or a CmpMethod
             max_iterations: Maximum iterations (None for unlimited)
             verbose: Print progress if True
 
         Returns:
             Number of iterations
         """
+        method = CmpMethod.from_name(compare_method)  # translated once per sort
+
         if max_iterations is None:
             max_iterations = self.size**2
 
         if verbose:
-            print(f"\nSorting by: {compare_method}")
+            print(f"\nSorting by: {method.name.lower()}")
             print(f"Initial: {self.to_list()}")
 
+        # Keys are computed once and swapped along with the cells
+        primary, secondary = self.sort_keys(method)
+
         iterations = 0
         for i in range(max_iterations):
-            if not self.sort_step(compare_method):
+            if not keyed_pass(primary, secondary, self.x, self.y):
                 iterations = i + 1
                 break
             iterations = i + 1
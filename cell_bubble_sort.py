@@ -1,121 +1,124 @@
 from typing import Sequence, Union
 import random
+import sys
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from tissue_kernels import as_value_array, bubble_pass, presorted_bubble_sort
 
 random.seed(1)
 
 
 class Cell:
-    def __init__(self, value: float):
-        self.value: float = value
-        self.prev: Cell | None = None
-        self.next: Cell | None = None
+    """A view of one slot in a CellTissue's value array."""
+
+    __slots__ = ("tissue", "index")
+
+    def __init__(self, tissue: "CellTissue", index: int):
+        self.tissue = tissue
+        self.index = index
+
+    @property
+    def value(self) -> float:
+        return self.tissue.values[self.index].item()
+
+    @property
+    def prev(self) -> "Cell | None":
+        if self.index == 0:
+            return None
+        return Cell(self.tissue, self.index - 1)
+
+    @property
+    def next(self) -> "Cell | None":
+        if self.index >= self.tissue.size - 1:
+            return None
+        return Cell(self.tissue, self.index + 1)
 
     def should_swap_next(self) -> bool:
-        if not self.next:
+        if self.index >= self.tissue.size - 1:
             return False
-        return self.value > self.next.value
+        values = self.tissue.values
+        return bool(values[self.index] > values[self.index + 1])
 
     def swap_with_next(self) -> bool:
-        if not self.next:
+        if self.index >= self.tissue.size - 1:
             return False
 
-        # Cell to be swapped with
-        next_to_self = self.next
-
-        # outer neighbors: Cells whose prev or next is affected by the swap
-        next_to_next = next_to_self.next
-        prev_to_self = self.prev
-
-        # update prev/next of outer neighbors
-        if prev_to_self:
-            prev_to_self.next = next_to_self
-        if next_to_next:
-            next_to_next.prev = self
+        values = self.tissue.values
+        i = self.index
+        values[i], values[i + 1] = values[i + 1], values[i]
 
-        # update next
-        next_to_self.prev = prev_to_self
-        next_to_self.next = self
-
-        # update self
-        self.prev = next_to_self
-        self.next = next_to_next
+        # the view follows its value to the next slot
+        self.index = i + 1
 
         return True
 
 
 class CellTissue:
-    def __init__(self, values: Sequence[Union[int, float]]):
-        cells: list[Cell] = [Cell(val) for val in values]
+    def __init__(self, values: Sequence[Union[int, float]], dtype: DTypeLike = None):
+        self.values = as_value_array(values, dtype)
+        self.size = len(self.values)
 
-        for i in range(len(cells)):
-            if i > 0:
-                cells[i].prev = cells[i - 1]
-            if i < len(cells) - 1:
-                cells[i].next = cells[i + 1]
+    @property
+    def head(self) -> Cell | None:
+        return Cell(self, 0) if self.size else None
 
-        self.head = cells[0]
-        self.size = len(cells)
+    @property
+    def values_view(self) -> np.ndarray:
+        """Read-only view of the value array; the cell at index i is slot i."""
+        view = self.values.view()
+        view.flags.writeable = False
+        return view
 
     def get_cell_at(self, index: int) -> Cell | None:
-        """Return the cell at a given distance from the linked-list's head."""
+        """Return the cell at a given distance from the tissue's head."""
 
-        current = self.head
-        for _ in range(index):
-            if not current:
-                return None
-            current = current.next
+        if not 0 <= index < self.size:
+            return None
 
-        return current
+        return Cell(self, index)
 
     def to_list(self) -> Sequence[Union[int, float]]:
-        """Convert the linked-list to a list of values."""
-
-        result = []
-        current = self.head
-        while current:
-            result.append(current.value)
-            current = current.next
+        """Convert the tissue to a list of values."""
 
-        return result
+        return self.values.tolist()
 
     def sort_step(self) -> bool:
         """Execute one pass of bubble sort."""
-        swapped = False
-        current = self.head
-
-        while current and current.next:
-            if current.should_swap_next():
-                if current == self.head:
-                    self.head = current.next
-                current.swap_with_next()
-                swapped = True
-                # don't update current here, current.next has been updated to
-                # point to the next node in swap_with_next()
-            else:
-                current = current.next  # didn't swap, so update current.next
-
-        return swapped
+        return bubble_pass(self.values)
 
     def sort(self, max_iterations: int | None = None, verbose: bool = False) -> int:
         if not max_iterations:
-            max_iterations = self.size**2  # upper bounds for bubble sort
+            # at most n - 1 passes swap, plus one that confirms the order
+            max_iterations = self.size
+        if verbose:
+            return self._sort_verbose(max_iterations)
+
+        if self.size < 2 or (self.values[:-1] <= self.values[1:]).all():
+            return 0  # already sorted: one vectorized check, no passes
+        # same result and pass count as bubble_sort, without numba or Cython
+        return presorted_bubble_sort(self.values, max_iterations)
+
+    def _sort_verbose(self, max_iterations: int) -> int:
+        """Sort pass by pass, logging each step. Output is written once at the end."""
+        lines = []
         iterations = 0
 
         for i in range(max_iterations):
             if not self.sort_step():
                 iterations = i  # + 1
-                if verbose:
-                    print(f"Final: {self.to_list()}")
-                    print(f"Sorted in {iterations} iterations")
-                    break
+                lines.append(f"Final: {self.to_list()}")
+                lines.append(f"Sorted in {iterations} iterations")
+                break
 
-            if verbose:
-                print(f"Step {i}: {self.to_list()}")
+            lines.append(f"Step {i}: {self.to_list()}")
 
             iterations = i + 1
         else:  # Python for/else (executed if for loop never hits the break statement)
-            if verbose:
-                print(f"Reached max iterations ({max_iterations})")
+            lines.append(f"Reached max iterations ({max_iterations})")
+
+        sys.stdout.write("\n".join(lines) + "\n")
         return iterations
 
 
@@ -123,7 +126,7 @@ def demo():
     values = [3, 1, 12, 9]
     print(f"Initial values: {values}")
     # values = [random.randint(1, 100) for _ in range(12)]
-    tissue = CellTissue(values)
+    tissue = CellTissue(values, dtype=np.int8)  # values in 1..100 fit in 8 bits
     tissue.sort(verbose=True)
 
 
@@ -13,6 +13,8 @@ class Cell:
     with its right neighbor based on local comparison rules.
     """
 
+    __slots__ = ("value", "left_neighbor", "right_neighbor")
+
     def __init__(self, value):
         self.value = value
         self.left_neighbor: Cell | None = None
@@ -67,6 +69,7 @@ class CellTissue:
         if not values:
             self.head = None
             self.size = 0
+            self._nodes = []
             return
 
         # Create cells
@@ -81,15 +84,14 @@ class CellTissue:
 
         self.head = cells[0]
         self.size = len(cells)
+        # Cells in list order, refreshed by sort_step, so lookups don't walk
+        self._nodes = cells
 
     def get_cell_at(self, index):
         """Get the cell at a specific index (for visualization/debugging)."""
-        current = self.head
-        for _ in range(index):
-            if not current:
-                return None
-            current = current.right_neighbor
-        return current
+        if 0 <= index < len(self._nodes):
+            return self._nodes[index]
+        return None
 
     def to_list(self):
         """Convert the linked list to a Python list for easy viewing."""
@@ -107,22 +109,30 @@ class CellTissue:
         Returns True if any swaps occurred.
         """
         swapped = False
-        current = self.head
 
-        while current and current.right_neighbor:
-            if current.should_swap_right():
-                # If this cell swaps, we need to update head if necessary
-                if current == self.head:
-                    self.head = current.right_neighbor
+        # Walk the linked list once, then iterate the contiguous node list
+        nodes = []
+        current = self.head
+        while current:
+            nodes.append(current)
+            current = current.right_neighbor
 
-                current.swap_with_right()
+        i = 0
+        while i < len(nodes) - 1:
+            cell = nodes[i]
+            right = nodes[i + 1]
+            if cell.value > right.value:
+                cell.swap_with_right()
+                nodes[i], nodes[i + 1] = right, cell
                 swapped = True
-                # After swap, current is now to the right of where it was,
-                # so we move to the next cell (which is now current.right_neighbor)
-                current = current.right_neighbor
-            else:
-                # No swap, just move to next cell
-                current = current.right_neighbor
+                # After swap, the cell is now at i + 1 and we move on to the
+                # cell to its right
+                i += 1
+            i += 1
+
+        if nodes:
+            self.head = nodes[0]
+        self._nodes = nodes
 
         return swapped
 
@@ -14,14 +14,15 @@ links = [
     "https://zalgorithm.com/tags",
 ]
 
-threads = []
-for link in links:
-    # using `args` to pass positional args and `kwards` for keyword args
-    t = threading.Thread(target=crawl, args=(link,), kwargs={"delay": 2})
-    threads.append(t)
+if __name__ == "__main__":
+    threads = []
+    for link in links:
+        # using `args` to pass positional args and `kwards` for keyword args
+        t = threading.Thread(target=crawl, args=(link,), kwargs={"delay": 2})
+        threads.append(t)
 
-for t in threads:
-    t.start()
+    for t in threads:
+        t.start()
 
-for t in threads:
-    t.join()
+    for t in threads:
+        t.join()
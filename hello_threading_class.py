@@ -12,6 +12,7 @@ class Destination:
             time.sleep(0.5)
 
 
-destination = Destination()
-thread = threading.Thread(target=destination.run, args=("foo", "bar"))
-thread.start()
+if __name__ == "__main__":
+    destination = Destination()
+    thread = threading.Thread(target=destination.run, args=("foo", "bar"))
+    thread.start()
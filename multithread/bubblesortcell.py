@@ -3,6 +3,13 @@ import time
 from .multithreadcell import MultiThreadCell, CellStatus
 from .cellgroup import GroupStatus
 import random
+import itertools
+
+# Pre-drawn coin flips, so move() doesn't call into `random` while holding the lock
+_COIN_FLIPS = itertools.cycle(random.choices((True, False), k=1 << 16))
+
+# Probability of a cell misreading a comparison (0 disables error injection)
+ERROR_RATE = 0
 
 
 class BubbleSortCell(MultiThreadCell):
@@ -94,7 +101,7 @@ class BubbleSortCell(MultiThreadCell):
                 or self.cells[int(target_position[0])].status == CellStatus.FREEZE
             )
         ):
-            err_happen = random.random() < 0
+            err_happen = ERROR_RATE > 0 and random.random() < ERROR_RATE
             if err_happen:
                 return not self.value > self.cells[int(target_position[0])].value
             if self.reverse_direction:
@@ -117,7 +124,7 @@ class BubbleSortCell(MultiThreadCell):
         if self.should_move():
             self.status_probe.record_compare_and_swap()
         # new logic - random check left or right
-        check_right = random.random() < 0.5
+        check_right = next(_COIN_FLIPS)
         if check_right:
             target_position = (
                 self.current_position[0] + self.cell_vision,
@@ -1,97 +1,41 @@
-# A basic (but broken for now) multithread implementation
-import threading
-import time
-import random
-
-
-class ThreadedCell(threading.Thread):
-    def __init__(self, value, index, cells, lock, stubborn=False):
-        threading.Thread.__init__(self)
-        self.value = value
-        self.index = index
-        self.cells = cells  # shared array of all cells
-        self.lock = lock  # shared lock
-        self.stubborn = stubborn
-        self.active = True
-        self.daemon = True  # thread dies when main program exits
-
-    def should_swap_with(self, neighbor_index):
-        """Check if we should swap with neighbor."""
-        if self.stubborn:
-            return False
-        if neighbor_index < 0 or neighbor_index >= len(self.cells):
-            return False
-        neighbor = self.cells[neighbor_index]
-        return self.value > neighbor.value
-
-    def run(self):
-        """Main loop - runs continuously in its own thread."""
-        while self.active:
-            self.lock.acquire()  # Get exclusive access
-            try:
-                # Randomly check left or right
-                direction = random.choice([-1, 1])
-                neighbor_index = self.index + direction
-
-                if self.should_swap_with(neighbor_index):
-                    # Swap positions in the array
-                    neighbor = self.cells[neighbor_index]
-                    self.cells[self.index], self.cells[neighbor_index] = neighbor, self
-                    self.index, neighbor.index = neighbor.index, self.index
-
-            finally:
-                self.lock.release()  # Always release lock
-
-            time.sleep(0.1)  # Brief pause to let other threads run
-
-    def run_bak(self):
-        direction = random.choice([-1, 1])
-        neighbor_index = self.index + direction
-        if self.should_swap_with(neighbor_index):
-            neighbor = self.cells[neighbor_index]
-            self.cells[self.index], self.cells[neighbor_index] = neighbor, self
-            self.index, neighbor.index = neighbor.index, self.index
-
-        time.sleep(0.1)
-
-    def stop(self):
-        self.active = False
+# A multithreaded implementation: odd-even transposition sort, where every
+# pair compared in a phase is disjoint and numba's prange splits the phase
+# across native threads (no GIL, no shared lock).
+import numpy as np
+
+from tissue_kernels import as_value_array, parallel_odd_even_sort, set_num_threads
 
 
 class ParallelCellTissue:
     def __init__(self, values):
-        self.lock = threading.Lock()
-        self.cells = [
-            ThreadedCell(val, i, None, self.lock) for i, val in enumerate(values)
-        ]
-        # Update cells array reference for all cells
-        for cell in self.cells:
-            cell.cells = self.cells
-
-    def start_sorting(self):
-        """Start all cell threads."""
-        for cell in self.cells:
-            cell.start()
-
-    def stop_sorting(self):
-        """Stop all cell threads."""
-        for cell in self.cells:
-            cell.stop()
-        for cell in self.cells:
-            cell.join()  # Wait for threads to finish
+        self.values = as_value_array(values)
+        self.stubborn = np.zeros(len(self.values), dtype=np.bool_)
+        self.size = len(self.values)
+
+    def sort(self, max_iterations=None, num_threads=None):
+        """
+        Sort the tissue with parallel odd-even phases.
+
+        Args:
+            max_iterations: Maximum number of rounds (None for unlimited)
+            num_threads: Number of worker threads (None for numba's default)
+
+        Returns:
+            Number of rounds that swapped
+        """
+        if max_iterations is None:
+            max_iterations = self.size**2
+        if num_threads:
+            set_num_threads(num_threads)
+        return parallel_odd_even_sort(self.values, self.stubborn, max_iterations)
 
     def get_values(self):
         """Get current state."""
-        self.lock.acquire()
-        try:
-            return [cell.value for cell in self.cells]
-        finally:
-            self.lock.release()
+        return self.values.tolist()
 
     def is_sorted(self):
         """Check if sorted."""
-        values = self.get_values()
-        return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+        return bool((self.values[:-1] <= self.values[1:]).all())
 
 
 # Usage
@@ -100,23 +44,15 @@ def demo_parallel():
     tissue = ParallelCellTissue(values)
 
     # Make index 5 stubborn
-    # tissue.cells[5].stubborn = True
-    #
+    # tissue.stubborn[5] = True
+
     print(f"Initial: {tissue.get_values()}")
-    #
-    tissue.start_sorting()
-    #
-    # # Monitor progress
-    # for i in range(20):
-    #     time.sleep(0.5)
-    #     current = tissue.get_values()
-    #     print(f"Step {i}: {current}")
-    #     if tissue.is_sorted():
-    #         print("Sorted!")
-    #         break
-    #
-    # tissue.stop_sorting()
-    # print(f"Final: {tissue.get_values()}")
+
+    rounds = tissue.sort()
+
+    print(f"Final: {tissue.get_values()} ({rounds} rounds)")
+    if tissue.is_sorted():
+        print("Sorted!")
 
 
 if __name__ == "__main__":
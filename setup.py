@@ -0,0 +1,10 @@
+"""
+Builds the optional Cython sort kernels in place:
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(ext_modules=cythonize("tissue_kernels_cy.pyx"))
@@ -0,0 +1,296 @@
+"""
+Sorting kernels shared by the array-backed tissues.
+
+Each kernel works in place on a tissue's value array (and, for stubborn
+tissues, its parallel boolean mask). Cells are array slots: swapping two
+cells swaps their slots.
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+try:
+    from numba import njit, prange, set_num_threads
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain Python kernels
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+    def set_num_threads(n):
+        pass
+
+
+# Value dtypes the 1D kernels are compiled for up front (loaded from the
+# on-disk cache after the first run), so the first sort() doesn't JIT.
+# as_value_array rejects any other dtype, with or without numba installed.
+VALUE_TYPES = ("int8", "int16", "int32", "int64", "float64")
+
+
+def signatures(template: str) -> list[str]:
+    """Expand a numba signature template once per value dtype."""
+    return [template.format(value_type) for value_type in VALUE_TYPES]
+
+
+def as_value_array(
+    values: Sequence[Union[int, float]], dtype: DTypeLike = None
+) -> np.ndarray:
+    """
+    Copy values into a contiguous array of the given dtype. By default that is
+    int64, or float64 if any values are floats. Narrower dtypes (e.g. int8 for
+    small values) pack more cells into each cache line.
+
+    Raises:
+        ValueError: If dtype is not one of VALUE_TYPES
+    """
+    if dtype is not None and np.dtype(dtype).name not in VALUE_TYPES:
+        raise ValueError(
+            f"Unsupported dtype {np.dtype(dtype).name!r}; "
+            f"expected one of {', '.join(VALUE_TYPES)}"
+        )
+    if dtype is None:
+        array = np.asarray(values)
+        kind = array.dtype.kind
+        dtype = np.int64 if kind in "biu" or array.size == 0 else np.float64
+    return np.array(values, dtype=dtype)
+
+
+@njit(cache=True)
+def _bubble_prefix_pass(values: np.ndarray, n_active: int) -> int:
+    """
+    Bubble pass over values[:n_active]. Returns one past the last slot that
+    swapped (0 if none); every slot from there on is in its final position.
+    """
+    last_swap = 0
+    for i in range(n_active - 1):
+        # branchless compare-and-swap: always write the ordered pair back
+        a = values[i]
+        b = values[i + 1]
+        values[i] = min(a, b)
+        values[i + 1] = max(a, b)
+        last_swap = i + 1 if a > b else last_swap
+    return last_swap
+
+
+@njit(cache=True)
+def _bubble_prefix_pass_stubborn(
+    values: np.ndarray, stubborn: np.ndarray, n_active: int
+) -> int:
+    """Stubborn-cell version of _bubble_prefix_pass."""
+    last_swap = 0
+    for i in range(n_active - 1):
+        a = values[i]
+        b = values[i + 1]
+        s = stubborn[i]
+        t = stubborn[i + 1]
+        # select rather than branch so the hot loop compiles to conditional moves
+        change = (a > b) & (not s)
+        values[i] = b if change else a
+        values[i + 1] = a if change else b
+        stubborn[i] = s | (change & t)
+        stubborn[i + 1] = t & (not change)
+        last_swap = i + 1 if change else last_swap
+    return last_swap
+
+
+# Fallback chain for the 1D passes and sorts: prebuilt Cython kernels (see
+# setup.py), then numba kernels, then the same code as plain Python. The
+# numba kernels are only defined (and compiled) when the Cython build is
+# missing.
+try:
+    from tissue_kernels_cy import (
+        bubble_pass,
+        bubble_pass_stubborn,
+        bubble_sort,
+        bubble_sort_stubborn,
+    )
+
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+if not CYTHON_AVAILABLE:
+
+    @njit(signatures("boolean({}[::1])"), cache=True)
+    def bubble_pass(values: np.ndarray) -> bool:
+        """Execute one pass of bubble sort. Returns True if any swaps occurred."""
+        return _bubble_prefix_pass(values, values.shape[0]) > 0
+
+    @njit(signatures("boolean({}[::1], boolean[::1])"), cache=True)
+    def bubble_pass_stubborn(values: np.ndarray, stubborn: np.ndarray) -> bool:
+        """
+        Execute one pass of bubble sort where stubborn cells refuse to initiate
+        a swap. The stubborn flag travels with its cell's value.
+        """
+        return _bubble_prefix_pass_stubborn(values, stubborn, values.shape[0]) > 0
+
+    @njit(signatures("int64({}[::1], int64)"), cache=True)
+    def bubble_sort(values: np.ndarray, max_iterations: int) -> int:
+        """
+        Run bubble sort passes until one makes no swaps, or max_iterations is
+        reached. Returns the number of passes that swapped. Each pass stops at
+        the previous pass's last swap, since everything past it is in place.
+        """
+        n_active = values.shape[0]
+        for i in range(max_iterations):
+            n_active = _bubble_prefix_pass(values, n_active)
+            if n_active == 0:
+                return i
+        return max_iterations
+
+    @njit(signatures("int64({}[::1], boolean[::1], int64)"), cache=True)
+    def bubble_sort_stubborn(
+        values: np.ndarray, stubborn: np.ndarray, max_iterations: int
+    ) -> int:
+        """
+        Stubborn-cell version of bubble_sort. Shrinking the active range is
+        still safe: a stubborn cell that blocks a pass has nothing bigger on its
+        left, so nothing can be carried past the last swap in a later pass.
+        """
+        n_active = values.shape[0]
+        for i in range(max_iterations):
+            n_active = _bubble_prefix_pass_stubborn(values, stubborn, n_active)
+            if n_active == 0:
+                return i
+        return max_iterations
+
+
+@njit(cache=True)
+def bubble_sort_counting(values: np.ndarray) -> tuple[int, int]:
+    """
+    Textbook bubble sort, for comparing against the tissues. Each pass stops
+    at the previous pass's last swap, and sorting ends once that leaves at
+    most one slot. Returns (iterations, swaps).
+    """
+    n = values.shape[0]
+    iterations = 0
+    swaps = 0
+    while n > 1:
+        last_swap = 0
+        for j in range(1, n):
+            if values[j - 1] > values[j]:
+                tmp = values[j - 1]
+                values[j - 1] = values[j]
+                values[j] = tmp
+                last_swap = j
+                swaps += 1
+        n = last_swap
+        iterations += 1
+    return iterations, swaps
+
+
+def odd_even_phase(
+    values: np.ndarray, start: int, pairs: bool = False
+) -> Union[bool, np.ndarray]:
+    """
+    Compare-and-swap the disjoint pairs (start, start + 1), (start + 2, ...).
+    Returns whether any pair swapped, or with pairs=True the left indices of
+    the pairs that swapped.
+    """
+    left = values[start:-1:2]
+    right = values[start + 1 :: 2]
+    swap = left > right
+    if not swap.any():
+        return np.empty(0, dtype=np.intp) if pairs else False
+    low = np.minimum(left, right)
+    np.maximum(left, right, out=right)
+    left[...] = low
+    return np.flatnonzero(swap) * 2 + start if pairs else True
+
+
+def odd_even_sort(values: np.ndarray, max_iterations: int) -> int:
+    """
+    Odd-even transposition sort: each round compares all even pairs at once,
+    then all odd pairs, as vectorized NumPy operations. Returns the number of
+    rounds that swapped.
+    """
+    for i in range(max_iterations):
+        swapped_even = odd_even_phase(values, 0)
+        swapped_odd = odd_even_phase(values, 1)
+        if not (swapped_even or swapped_odd):
+            return i
+    return max_iterations
+
+
+@njit(cache=True)
+def _swap(values: np.ndarray, i: int):
+    """Swap slots i and i + 1."""
+    tmp = values[i]
+    values[i] = values[i + 1]
+    values[i + 1] = tmp
+
+
+@njit(cache=True)
+def keyed_pass(
+    primary: np.ndarray, secondary: np.ndarray, x: np.ndarray, y: np.ndarray
+) -> bool:
+    """
+    One bubble pass over 2D points ordered by (primary, secondary) keys.
+    Keys and coordinates are swapped in lockstep; a cell that just swapped
+    is not compared again until the next pass.
+    """
+    swapped = False
+    i = 0
+    while i < primary.shape[0] - 1:
+        if primary[i] > primary[i + 1] or (
+            primary[i] == primary[i + 1] and secondary[i] > secondary[i + 1]
+        ):
+            _swap(primary, i)
+            _swap(secondary, i)
+            _swap(x, i)
+            _swap(y, i)
+            swapped = True
+            i += 1  # the moved cell waits for the next pass
+        i += 1
+    return swapped
+
+
+def presorted_bubble_sort(values: np.ndarray, max_iterations: int) -> int:
+    """
+    Reach bubble sort's result with NumPy's sort. Bubble sort moves each
+    value at most one slot left per pass, so the number of passes that swap
+    is the largest leftward displacement in the (stable) sorted order.
+    Falls back to bubble_sort if that exceeds max_iterations.
+    """
+    order = np.argsort(values, kind="stable")
+    passes = int((order - np.arange(values.shape[0])).max(initial=0))
+    if passes > max_iterations:
+        return bubble_sort(values, max_iterations)
+    values[...] = values[order]
+    return passes
+
+
+# Compiled on first call: only multithread_stubborn_bubble_sort uses it
+@njit(cache=True, parallel=True)
+def parallel_odd_even_sort(
+    values: np.ndarray, stubborn: np.ndarray, max_iterations: int
+) -> int:
+    """
+    Odd-even transposition sort with stubborn cells. The pairs compared in
+    a phase are disjoint, so each phase is split across threads with prange.
+    Returns the number of rounds that swapped.
+    """
+    n = values.shape[0]
+    for iteration in range(max_iterations):
+        swaps = 0
+        for start in range(2):
+            for k in prange((n - start) // 2):
+                i = start + 2 * k
+                if not stubborn[i] and values[i] > values[i + 1]:
+                    tmp = values[i]
+                    values[i] = values[i + 1]
+                    values[i + 1] = tmp
+                    stubborn[i] = stubborn[i + 1]
+                    stubborn[i + 1] = False
+                    swaps += 1
+        if swaps == 0:
+            return iteration
+    return max_iterations
@@ -0,0 +1,98 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython builds of the 1D bubble sort kernels in tissue_kernels.py.
+
+These ship precompiled, so unlike the numba kernels they cost nothing on
+first call. Build with:
+
+    python setup.py build_ext --inplace
+"""
+
+import numpy as np
+
+ctypedef fused value_t:
+    signed char
+    short
+    int
+    long long
+    double
+
+
+cdef Py_ssize_t _bubble_prefix_pass(value_t[::1] values, Py_ssize_t n_active) noexcept nogil:
+    cdef Py_ssize_t i, last_swap = 0
+    cdef value_t a, b
+    for i in range(n_active - 1):
+        # branchless compare-and-swap: always write the ordered pair back
+        a = values[i]
+        b = values[i + 1]
+        values[i] = b if a > b else a
+        values[i + 1] = a if a > b else b
+        last_swap = i + 1 if a > b else last_swap
+    return last_swap
+
+
+cdef Py_ssize_t _bubble_prefix_pass_stubborn(
+    value_t[::1] values, unsigned char[::1] stubborn, Py_ssize_t n_active
+) noexcept nogil:
+    cdef Py_ssize_t i, last_swap = 0
+    cdef value_t a, b
+    cdef unsigned char s, t, change
+    for i in range(n_active - 1):
+        a = values[i]
+        b = values[i + 1]
+        s = stubborn[i]
+        t = stubborn[i + 1]
+        change = a > b and not s
+        values[i] = b if change else a
+        values[i + 1] = a if change else b
+        stubborn[i] = s | (change & t)
+        stubborn[i + 1] = t & (not change)
+        last_swap = i + 1 if change else last_swap
+    return last_swap
+
+
+def bubble_pass(value_t[::1] values):
+    """Execute one pass of bubble sort. Returns True if any swaps occurred."""
+    cdef Py_ssize_t last_swap
+    with nogil:
+        last_swap = _bubble_prefix_pass(values, values.shape[0])
+    return last_swap > 0
+
+
+def bubble_pass_stubborn(value_t[::1] values, stubborn):
+    """Stubborn-cell version of bubble_pass."""
+    cdef unsigned char[::1] flags = stubborn.view(np.uint8)
+    cdef Py_ssize_t last_swap
+    with nogil:
+        last_swap = _bubble_prefix_pass_stubborn(values, flags, values.shape[0])
+    return last_swap > 0
+
+
+def bubble_sort(value_t[::1] values, long long max_iterations):
+    """
+    Run bubble sort passes until one makes no swaps, or max_iterations is
+    reached. Returns the number of passes that swapped.
+    """
+    cdef long long i, passes = max_iterations
+    cdef Py_ssize_t n_active = values.shape[0]
+    with nogil:
+        for i in range(max_iterations):
+            n_active = _bubble_prefix_pass(values, n_active)
+            if n_active == 0:
+                passes = i
+                break
+    return passes
+
+
+def bubble_sort_stubborn(value_t[::1] values, stubborn, long long max_iterations):
+    """Stubborn-cell version of bubble_sort."""
+    cdef unsigned char[::1] flags = stubborn.view(np.uint8)
+    cdef long long i, passes = max_iterations
+    cdef Py_ssize_t n_active = values.shape[0]
+    with nogil:
+        for i in range(max_iterations):
+            n_active = _bubble_prefix_pass_stubborn(values, flags, n_active)
+            if n_active == 0:
+                passes = i
+                break
+    return passes
@@ -3,40 +3,62 @@ Visualization of Decentralized Cell Sorting
 Shows how cells autonomously swap with neighbors
 """
 
-from cell_bubble_sort import Cell, CellTissue
+import io
+import sys
+import time
+from functools import lru_cache, partial
 
+import numpy as np
 
-def visualize_tissue(tissue, highlight_indices=None):
+from cell_bubble_sort import CellTissue
+from tissue_kernels import bubble_sort_counting, odd_even_phase, odd_even_sort
+
+_BAR = "=" * 60
+_DNA_BANNER = "🧬 " * 20
+
+
+@lru_cache(maxsize=32)
+def _borders(n):
+    """Top and bottom borders for a tissue of n cells."""
+    bar = "─" * (n * 6 - 1)
+    return "┌" + bar + "┐", "└" + bar + "┘"
+
+
+def visualize_tissue(values, highlight_mask=0):
     """
     Create a visual representation of the tissue showing cell values
     and their connections.
 
     Args:
-        tissue: CellTissue object
-        highlight_indices: List of indices to highlight (cells that just swapped)
+        values: List of cell values, e.g. from CellTissue.to_list()
+        highlight_mask: Bitmask of indices to highlight (cells that just swapped);
+            bit i set highlights cell i
     """
-    values = tissue.to_list()
+    # Values with highlighting, formatted in one pass from a template
+    if highlight_mask:
+        template = "".join(
+            " [%2d] " if (highlight_mask >> i) & 1 else "  %2d  "
+            for i in range(len(values))
+        )
+    else:
+        template = "  %2d  " * len(values)
+    value_line = "│" + template % tuple(values) + "│"
 
-    # Create a visual representation
-    lines = []
+    top, bottom = _borders(len(values))
+    return "\n".join([top, value_line, bottom])
 
-    # Top border
-    lines.append("┌" + "─" * (len(values) * 6 - 1) + "┐")
 
-    # Values with highlighting
-    value_line = "│"
-    for i, val in enumerate(values):
-        if highlight_indices and i in highlight_indices:
-            value_line += f" [{val:2d}] "
-        else:
-            value_line += f"  {val:2d}  "
-    value_line += "│"
-    lines.append(value_line)
+def _block(*lines, file=None):
+    """Write lines as one block, to file or stdout."""
+    (file or sys.stdout).write("\n".join(lines) + "\n")
 
-    # Bottom border
-    lines.append("└" + "─" * (len(values) * 6 - 1) + "┘")
 
-    return "\n".join(lines)
+def _drain(buffer):
+    """Write out and clear animated_sort's output buffer, if it has one."""
+    if buffer is not None:
+        sys.stdout.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
 
 
 def visualize_swap(tissue, cell_index):
@@ -49,10 +71,11 @@ def visualize_swap(tissue, cell_index):
     """
     print(f"\n  Cell at index {cell_index} comparing with neighbor...")
 
-    cell = tissue.get_cell_at(cell_index)
-    if cell and cell.right_neighbor:
-        print(f"  {cell.value} > {cell.right_neighbor.value}? ", end="")
-        if cell.should_swap_right():
+    values = tissue.values_view
+    if 0 <= cell_index < len(values) - 1:
+        value, right = values[cell_index], values[cell_index + 1]
+        print(f"  {value} > {right}? ", end="")
+        if value > right:
             print("YES → SWAP!")
             return True
         else:
@@ -69,150 +92,167 @@ def animated_sort(values, delay=0.5):
         values: List of values to sort
         delay: Delay between steps (seconds)
     """
-    import time
-
-    print("\n" + "=" * 60)
-    print("ANIMATED CELL SORTING")
-    print("=" * 60)
-    print("\nInitial tissue:")
+    # With no delay nothing is watching the animation, so buffer the output
+    # and write it once per iteration instead of once per line
+    buffer = io.StringIO() if delay == 0 else None
+    emit = partial(_block, file=buffer)
+    sleep = time.sleep if delay > 0 else lambda seconds: None
 
     tissue = CellTissue(values)
-    print(visualize_tissue(tissue))
-    print(f"\nValues: {tissue.to_list()}")
-
-    time.sleep(delay * 2)
+    current = tissue.to_list()
+    emit(
+        "",
+        _BAR,
+        "ANIMATED CELL SORTING",
+        _BAR,
+        "\nInitial tissue:",
+        visualize_tissue(current),
+        f"\nValues: {current}",
+    )
+
+    sleep(delay * 2)
+
+    # Sort the tissue's own value array in place and render from the tissue
+    a = tissue.values
 
     iteration = 0
-    max_iterations = len(values) ** 2
+    # n phases (ceil(n / 2) rounds) sort any input, plus one round to confirm
+    max_iterations = (len(values) + 1) // 2 + 1
 
     for iteration in range(max_iterations):
-        print(f"\n{'=' * 60}")
-        print(f"ITERATION {iteration + 1}")
-        print("=" * 60)
+        emit("", _BAR, f"ITERATION {iteration + 1}", _BAR)
 
         swapped = False
-        current = tissue.head
-        index = 0
 
-        # Track which cells swap in this iteration
-        swap_indices = []
-
-        while current and current.right_neighbor:
-            if current.should_swap_right():
-                print(f"\nCell {index} deciding:")
-                print(
-                    f"  Value: {current.value} vs Right neighbor: {current.right_neighbor.value}"
-                )
-                print(
-                    f"  Decision: SWAP! ({current.value} > {current.right_neighbor.value})"
+        # Odd-even transposition: every cell at an even index decides at once,
+        # then every cell at an odd index. The pairs in a phase are disjoint.
+        for start in (0, 1):
+            swap_indices = odd_even_phase(a, start, pairs=True).tolist()
+            if not swap_indices:
+                continue
+
+            # The pair has already swapped, so the deciding value is on the right
+            for index in swap_indices:
+                emit(
+                    f"\nCell {index} deciding:",
+                    f"  Value: {a[index + 1]} vs Right neighbor: {a[index]}",
+                    f"  Decision: SWAP! ({a[index + 1]} > {a[index]})",
                 )
 
-                # Update head if necessary
-                if current == tissue.head:
-                    tissue.head = current.right_neighbor
-
-                # Remember these indices for highlighting
-                swap_indices.extend([index, index + 1])
+            swapped = True
 
-                current.swap_with_right()
-                swapped = True
-                time.sleep(delay)
+            # Show tissue after the phase's swaps, highlighting both cells of each
+            # pair. Without a delay only the end-of-iteration state is drawn.
+            if delay > 0:
+                highlight = 0
+                for index in swap_indices:
+                    highlight |= 0b11 << index
+                emit("\n  After swap:", visualize_tissue(tissue.to_list(), highlight))
 
-                # Show tissue after swap
-                print("\n  After swap:")
-                print(visualize_tissue(tissue, swap_indices))
-
-                # Move to next cell
-                current = current.right_neighbor
-                index += 1
-            else:
-                current = current.right_neighbor
-                index += 1
-
-        print(f"\nState after iteration {iteration + 1}:")
-        print(visualize_tissue(tissue))
-        print(f"Values: {tissue.to_list()}")
+        current = tissue.to_list()
+        emit(
+            f"\nState after iteration {iteration + 1}:",
+            visualize_tissue(current),
+            f"Values: {current}",
+        )
 
         if not swapped:
-            print("\n✓ No swaps occurred - SORTED!")
+            emit("\n✓ No swaps occurred - SORTED!")
             break
 
-        time.sleep(delay)
+        _drain(buffer)
+        sleep(delay)
 
-    print("\n" + "=" * 60)
-    print("FINAL RESULT")
-    print("=" * 60)
-    print(visualize_tissue(tissue))
-    print(f"Values: {tissue.to_list()}")
-    print(f"\nCompleted in {iteration + 1} iterations")
+    emit(
+        "",
+        _BAR,
+        "FINAL RESULT",
+        _BAR,
+        visualize_tissue(current),
+        f"Values: {current}",
+        f"\nCompleted in {iteration + 1} iterations",
+    )
+    _drain(buffer)
 
 
 def compare_approaches(values):
     """
     Compare the decentralized cell approach with traditional bubble sort.
     """
-    print("\n" + "=" * 60)
-    print("COMPARISON: Decentralized Cells vs Traditional Algorithm")
-    print("=" * 60)
-
-    print(f"\nInitial array: {values}")
+    _block(
+        "",
+        _BAR,
+        "COMPARISON: Decentralized Cells vs Traditional Algorithm",
+        _BAR,
+        f"\nInitial array: {values}",
+    )
 
     # Traditional bubble sort
-    print("\n--- Traditional Bubble Sort ---")
-    print("(Centralized control, algorithm manages all swaps)")
+    _block(
+        "\n--- Traditional Bubble Sort ---",
+        "(Centralized control, algorithm manages all swaps)",
+    )
 
-    arr = values.copy()
-    iterations_trad = 0
-    swaps_trad = 0
+    arr = np.ascontiguousarray(values, dtype=np.int64)
+    iterations_trad, swaps_trad = bubble_sort_counting(arr)
 
-    for i in range(len(arr)):
-        swapped = False
-        for j in range(len(arr) - 1 - i):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-                swaps_trad += 1
-        iterations_trad += 1
-        if not swapped:
-            break
-
-    print(f"Result: {arr}")
-    print(f"Iterations: {iterations_trad}")
-    print(f"Swaps: {swaps_trad}")
+    _block(
+        f"Result: {arr.tolist()}",
+        f"Iterations: {iterations_trad}",
+        f"Swaps: {swaps_trad}",
+    )
 
     # Cell-based sort
-    print("\n--- Decentralized Cell Sort ---")
-    print("(Distributed intelligence, each cell decides independently)")
+    _block(
+        "\n--- Decentralized Cell Sort ---",
+        "(Distributed intelligence, each cell decides independently)",
+    )
 
     tissue = CellTissue(values.copy())
     iterations_cell = tissue.sort()
 
-    print(f"Result: {tissue.to_list()}")
-    print(f"Iterations: {iterations_cell}")
+    _block(f"Result: {tissue.to_list()}", f"Iterations: {iterations_cell}")
+
+    # Odd-even transposition sort
+    _block(
+        "\n--- Odd-Even Transposition Sort ---",
+        "(All even pairs decide at once, then all odd pairs)",
+    )
+
+    arr = np.ascontiguousarray(values, dtype=np.int64)
+    rounds = odd_even_sort(arr, len(arr))
 
-    print("\n" + "=" * 60)
-    print("Analysis:")
-    print(f"  Both approaches perform the same number of comparisons")
-    print(f"  But the cell-based approach demonstrates 'basal intelligence'")
-    print(f"  Each cell is an autonomous agent making local decisions")
-    print("=" * 60)
+    _block(f"Result: {arr.tolist()}", f"Rounds: {rounds}")
+
+    _block(
+        "",
+        _BAR,
+        "Analysis:",
+        "  All three approaches only ever swap neighbouring cells",
+        "  Bubble sort and the cell tissue make the same swaps, pass for pass",
+        "  Odd-even rounds compare all disjoint pairs at once, so fewer rounds",
+        "  But the cell-based approach demonstrates 'basal intelligence'",
+        "  Each cell is an autonomous agent making local decisions",
+        _BAR,
+    )
 
 
 if __name__ == "__main__":
+    # Run the examples named on the command line (animated, compare, quick),
+    # or all of them
+    examples = set(sys.argv[1:]) or {"animated", "compare", "quick"}
+
     # Example 1: Small animated sort
-    print("\n" + "🧬 " * 20)
-    print("EXAMPLE 1: Small Array (Animated)")
-    print("🧬 " * 20)
-    animated_sort([5, 2, 8, 1, 9], delay=0.3)
+    if "animated" in examples:
+        _block("", _DNA_BANNER, "EXAMPLE 1: Small Array (Animated)", _DNA_BANNER)
+        animated_sort([5, 2, 8, 1, 9], delay=0.3)
 
     # Example 2: Comparison
-    print("\n\n" + "🧬 " * 20)
-    print("EXAMPLE 2: Comparing Approaches")
-    print("🧬 " * 20)
-    compare_approaches([64, 34, 25, 12, 22, 11, 90])
+    if "compare" in examples:
+        _block("", "", _DNA_BANNER, "EXAMPLE 2: Comparing Approaches", _DNA_BANNER)
+        compare_approaches([64, 34, 25, 12, 22, 11, 90])
 
     # Example 3: Larger animated sort (no delays)
-    print("\n\n" + "🧬 " * 20)
-    print("EXAMPLE 3: Reverse Sorted (Quick)")
-    print("🧬 " * 20)
-    animated_sort([7, 6, 5, 4, 3, 2, 1], delay=0.0)
+    if "quick" in examples:
+        _block("", "", _DNA_BANNER, "EXAMPLE 3: Reverse Sorted (Quick)", _DNA_BANNER)
+        animated_sort([7, 6, 5, 4, 3, 2, 1], delay=0.0)